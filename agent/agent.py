@@ -11,6 +11,19 @@ from agent.tools import filter_materials, rag_search
 # Default model path constant
 DEFAULT_MODEL_PATH = "models/qwen2.5-3b-instruct-q4_k_m.gguf"
 
+# Static prompt prefix, never interpolated. llama.cpp and OpenAI-style
+# servers cache KV states for the longest shared prefix, so keeping the
+# instructions byte-identical across queries means only the dynamic tail
+# (question, materials, documents) is re-evaluated on each call.
+SYSTEM_PROMPT = """You are a helpful assistant for sustainable renovation planning. Answer the user's question based on the provided materials and documents.
+
+Please provide a clear, helpful recommendation that:
+1. Addresses the user's specific question
+2. References specific materials when relevant
+3. Incorporates information from the documents
+4. Considers sustainability and eco-friendliness
+5. Is practical and actionable"""
+
 
 class RenovationAgent:
     """Agent that combines structured filtering and RAG retrieval."""
@@ -20,22 +33,29 @@ class RenovationAgent:
         mode: str = "direct",
         llm_url: Optional[str] = None,
         model_name: str = "local-llm",
-        model_path: Optional[str] = None
+        model_path: Optional[str] = None,
+        use_similarity_cache: bool = False
     ):
         """
         Initialize the renovation agent.
-        
+
         Args:
             mode: "direct" (default) or "server". Direct uses llama_cpp directly, server uses HTTP API.
             llm_url: URL of the LLM server (only used in server mode)
             model_name: Model name to use in API calls (server mode)
             model_path: Path to GGUF model file (direct mode). Auto-detected if not provided.
+            use_similarity_cache: Reuse cached responses for near-identical prompts
+                (cosine similarity of prompt embeddings above 0.98).
         """
         self.mode = mode
         self.llm_url = llm_url or os.getenv("LLM_URL", "http://localhost:8000/v1/chat/completions")
         self.model_name = model_name
         self.model_path = model_path or self._find_model_path()
         self._llm_model = None
+        self._similarity_cache = None
+        if use_similarity_cache:
+            from agent.llm_cache import LLMSimilarityCache
+            self._similarity_cache = LLMSimilarityCache()
         
     def _find_model_path(self) -> Optional[str]:
         """Find model file automatically."""
@@ -89,17 +109,31 @@ class RenovationAgent:
     def call_llm(self, prompt: str, max_tokens: int = 500) -> str:
         """
         Call the local LLM.
-        
+
         In direct mode: Uses llama_cpp.Llama directly.
         In server mode: Uses HTTP API to llama_cpp.server.
-        
+
+        When the similarity cache is enabled, a near-identical cached prompt
+        short-circuits the call and its stored response is returned instead.
+
         Args:
             prompt: User prompt
             max_tokens: Maximum tokens to generate
-            
+
         Returns:
             Generated response text
         """
+        if self._similarity_cache is not None:
+            cached = self._similarity_cache.lookup(prompt)
+            if cached is not None:
+                return cached
+        response = self._call_llm_uncached(prompt, max_tokens)
+        if self._similarity_cache is not None and not response.startswith("Error"):
+            self._similarity_cache.store(prompt, response)
+        return response
+
+    def _call_llm_uncached(self, prompt: str, max_tokens: int = 500) -> str:
+        """Dispatch the LLM call for the configured mode, bypassing caches."""
         # Direct mode (default)
         if self.mode == "direct":
             llm = self._get_direct_llm()
@@ -204,7 +238,9 @@ class RenovationAgent:
         materials_str = json.dumps(materials, indent=2) if materials else "No materials found matching the criteria."
         docs_str = "\n\n".join([f"[Document {i+1}]\n{doc}" for i, doc in enumerate(docs)]) if docs else "No relevant documents found."
         
-        prompt = f"""You are a helpful assistant for sustainable renovation planning. Answer the user's question based on the provided materials and documents.
+        # Static prefix first, dynamic content last: maximizes the
+        # KV-prefix cache hit region across queries
+        prompt = f"""{SYSTEM_PROMPT}
 
 User question: {query}
 
@@ -214,13 +250,6 @@ Candidate materials from database:
 Relevant documents:
 {docs_str}
 
-Please provide a clear, helpful recommendation that:
-1. Addresses the user's specific question
-2. References specific materials when relevant
-3. Incorporates information from the documents
-4. Considers sustainability and eco-friendliness
-5. Is practical and actionable
-
 Response:"""
         
         return self.call_llm(prompt)
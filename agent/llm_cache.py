@@ -0,0 +1,154 @@
+"""
+Similarity cache for LLM responses.
+
+Exact-prompt caching only helps byte-identical prompts; real usage hits
+near-duplicates ("low VOC paint for kids room" vs "low-VOC paint for a
+kid's room"). This cache keys entries by normalized prompt embeddings
+and returns the stored response when the nearest cached prompt is above
+a cosine-similarity threshold, skipping the LLM call entirely.
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+from typing import Optional
+
+# Cosine similarity required to treat a cached prompt as a hit
+SIMILARITY_THRESHOLD = 0.98
+
+# Oldest entries are evicted beyond this count, bounding memory and disk
+MAX_ENTRIES = 512
+
+# Persist once per this many inserts instead of on every store; call
+# flush() to force the newest entries to disk
+SAVE_EVERY = 16
+
+DEFAULT_CACHE_DIR = Path(".cache") / "llm"
+
+
+class LLMSimilarityCache:
+    """Embedding-keyed response cache with on-disk persistence."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        threshold: float = SIMILARITY_THRESHOLD,
+        model_name: str = "BAAI/bge-small-en-v1.5",
+        max_entries: int = MAX_ENTRIES,
+    ):
+        """
+        Initialize the cache, loading any persisted entries.
+
+        Args:
+            cache_dir: Directory for the persisted .npy/.json pair
+            threshold: Minimum cosine similarity for a cache hit
+            model_name: Embedding model used to key prompts
+            max_entries: Entry cap; oldest entries are evicted past it
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.threshold = threshold
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self._embedder = None
+        self._dirty = 0
+
+        # Two aligned stores: row i of the embedding matrix corresponds
+        # to response i. Matrix is float32 and L2-normalized, so lookup
+        # is a single matvec.
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+        self._responses = []
+        self._load()
+
+    @property
+    def _emb_path(self) -> Path:
+        return self.cache_dir / "embeddings.npy"
+
+    @property
+    def _resp_path(self) -> Path:
+        return self.cache_dir / "responses.json"
+
+    def _load(self) -> None:
+        """Load persisted cache entries if both files are present."""
+        if not (self._emb_path.exists() and self._resp_path.exists()):
+            return
+        try:
+            embeddings = np.load(self._emb_path)
+            with open(self._resp_path, "r", encoding="utf-8") as f:
+                responses = json.load(f)
+        except (OSError, ValueError, json.JSONDecodeError):
+            return
+        if len(responses) == embeddings.shape[0]:
+            # Respect the cap even if the file was written with a larger one
+            if len(responses) > self.max_entries:
+                embeddings = embeddings[-self.max_entries:]
+                responses = responses[-self.max_entries:]
+            self._embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            self._responses = responses
+
+    def _save(self) -> None:
+        """Persist the aligned stores; cache stays usable if this fails."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            np.save(self._emb_path, self._embeddings)
+            with open(self._resp_path, "w", encoding="utf-8") as f:
+                json.dump(self._responses, f, ensure_ascii=False)
+        except OSError:
+            pass
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        """Encode the prompt to a normalized float32 vector."""
+        if self._embedder is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._embedder = SentenceTransformer(self.model_name)
+        vector = self._embedder.encode(
+            [prompt],
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )[0]
+        return np.ascontiguousarray(vector, dtype=np.float32)
+
+    def lookup(self, prompt: str) -> Optional[str]:
+        """
+        Return the cached response for the nearest prompt, or None.
+
+        A hit requires cosine similarity above the threshold; embeddings
+        are normalized, so the dot product is the cosine.
+        """
+        if not self._responses:
+            return None
+        query = self._embed(prompt)
+        sims = self._embeddings @ query
+        best = int(sims.argmax())
+        if sims[best] > self.threshold:
+            return self._responses[best]
+        return None
+
+    def store(self, prompt: str, response: str) -> None:
+        """
+        Add a prompt/response pair, evicting the oldest entry past the cap.
+
+        Writes reach disk once every SAVE_EVERY inserts rather than per
+        store; call flush() to persist the newest entries immediately.
+        """
+        vector = self._embed(prompt)[None, :]
+        if self._embeddings.size:
+            self._embeddings = np.vstack([self._embeddings, vector])
+        else:
+            self._embeddings = vector
+        self._responses.append(response)
+
+        if len(self._responses) > self.max_entries:
+            excess = len(self._responses) - self.max_entries
+            self._embeddings = np.ascontiguousarray(self._embeddings[excess:])
+            del self._responses[:excess]
+
+        self._dirty += 1
+        if self._dirty >= SAVE_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist any unwritten entries to disk."""
+        self._save()
+        self._dirty = 0
@@ -0,0 +1,58 @@
+"""
+Numba-accelerated scoring kernel for the in-memory retriever.
+
+Numba is an optional dependency: when it is not installed, `topk_cosine`
+is None and the retriever falls back to its NumPy scoring paths.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+topk_cosine = None
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def topk_cosine(mat, q, k, tau):  # pragma: no cover - compiled
+        """
+        Compute cosine scores of q against every row of mat and return the
+        top-k (indices, scores) at or above tau, sorted by descending score.
+
+        The dot products run in parallel over rows; the scalar inner loop
+        is auto-vectorized by LLVM. Selection keeps a small sorted buffer
+        of size k instead of sorting the full score array. Rows below tau
+        are dropped, matching the streaming scorer's threshold gate, so
+        fewer than k entries may come back.
+        """
+        n = mat.shape[0]
+        d = mat.shape[1]
+        sims = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            acc = np.float32(0.0)
+            for j in range(d):
+                acc += mat[i, j] * q[j]
+            sims[i] = acc
+
+        kk = min(k, n)
+        best_scores = np.full(kk, -np.inf, dtype=np.float32)
+        best_idx = np.zeros(kk, dtype=np.int64)
+        count = 0
+        for i in range(n):
+            s = sims[i]
+            if s >= tau and s > best_scores[kk - 1]:
+                pos = kk - 1
+                while pos > 0 and best_scores[pos - 1] < s:
+                    best_scores[pos] = best_scores[pos - 1]
+                    best_idx[pos] = best_idx[pos - 1]
+                    pos -= 1
+                best_scores[pos] = s
+                best_idx[pos] = i
+                if count < kk:
+                    count += 1
+
+        return best_idx[:count], best_scores[:count]
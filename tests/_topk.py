@@ -0,0 +1,26 @@
+"""
+Shared top-k selection helper for retrieval tests.
+
+np.argmax only covers top-1; once tests retrieve more than one document,
+a full argsort is O(n log n). topk_idx partitions first and sorts only
+the k selected entries, so it scales cleanly to thousands of docs.
+"""
+
+import numpy as np
+
+
+def topk_idx(sims: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return the indices of the k highest similarities, best first.
+
+    Args:
+        sims: 1-D similarity scores
+        k: Number of indices to return
+
+    Returns:
+        Index array of length min(k, sims.size), sorted by descending score
+    """
+    if k >= sims.size:
+        return np.argsort(-sims)
+    idx = np.argpartition(-sims, k)[:k]
+    return idx[np.argsort(-sims[idx])]
@@ -48,6 +48,56 @@ def patch_materials(monkeypatch: pytest.MonkeyPatch, materials_df: pd.DataFrame)
     return materials_df
 
 
+@pytest.fixture(scope="session")
+def direct_agent():
+    """
+    Share one direct-mode agent across the test session.
+
+    Constructing RenovationAgent(mode="direct") per test reloads the GGUF
+    model into RAM each time; call_llm keeps no per-query state, so one
+    instance is safe to reuse.
+    """
+    from agent.agent import RenovationAgent
+
+    return RenovationAgent(mode="direct")
+
+
+@pytest.fixture(scope="session")
+def st_model():
+    """
+    Load the embedding model once and share it across the test session.
+
+    With ECO_FAST_TESTS=1 the smoke tests use a TF-IDF fallback instead,
+    so the transformer is never loaded and this returns None.
+    """
+    import os
+
+    if os.getenv("ECO_FAST_TESTS"):
+        return None
+
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer("BAAI/bge-small-en-v1.5")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_numba():
+    """
+    Trigger numba JIT compilation once, up front, on tiny inputs.
+
+    The kernel uses cache=True, so after the first session the compiled
+    code is loaded from disk; this fixture just keeps the one-off compile
+    cost out of whichever test happens to hit the kernel first.
+    """
+    from rag._search_kernel import topk_cosine
+
+    if topk_cosine is not None:
+        import numpy as np
+
+        emb = np.eye(2, dtype=np.float32)
+        topk_cosine(emb, emb[0], 1, np.float32(0.0))
+
+
 @pytest.fixture(scope="session")
 def sample_sentences() -> List[str]:
     """Provide a few simple sentences for embedding tests."""
@@ -0,0 +1,238 @@
+"""
+Experiment harness: run an LLM client over a small prompt dataset and
+compute simple quality metrics.
+
+LLMClient is a deterministic stub standing in for a real model so the
+experiment loop and metrics can run anywhere; swap generate() for a
+real client to benchmark actual models.
+"""
+
+import functools
+import json
+import re
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # pragma: no cover - optional dependency
+    Levenshtein = None
+
+
+@dataclass
+class Example:
+    """One prompt/expected pair, with the model prediction filled in later."""
+
+    prompt: str
+    expected: str
+    prediction: Optional[str] = None
+
+
+# Precompiled whitespace collapse; one regex pass beats split + join,
+# which allocates a list of fragments per call
+_WS_RE = re.compile(r"\s+")
+
+# Newline-to-space mapping built once; str.translate is a single C pass
+# where chained .replace calls each allocate an intermediate string
+_NL_TO_SPACE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+
+def clean_text(text: str) -> str:
+    """Normalize text for comparison: lowercase and collapse whitespace."""
+    return _WS_RE.sub(" ", text.lower()).strip()
+
+
+def clean_text_batch(texts: List[str]) -> List[str]:
+    """Normalize a batch of texts, looping in C via map."""
+    return list(map(clean_text, texts))
+
+
+@functools.lru_cache(maxsize=2048)
+def _gen(prompt: str) -> str:
+    """
+    Stub generation as a pure cached function.
+
+    Identical prompts always produce identical output, so results are
+    memoized: repeated prompts cost a dict lookup instead of a model
+    call. Real clients get the same win from exact-prompt caching.
+    """
+    text = prompt.translate(_NL_TO_SPACE).strip()
+    return text if len(text) <= 120 else text[:120] + "..."
+
+
+class LLMClient:
+    """Stub LLM client used by the experiment tests."""
+
+    def generate(self, prompt: str, disable_cache: bool = False) -> str:
+        """
+        Generate a response for the prompt.
+
+        Args:
+            prompt: Input prompt text
+            disable_cache: Bypass the prompt cache (for real-model swap-ins
+                where sampling makes outputs non-deterministic)
+
+        Returns:
+            Generated response text
+        """
+        if disable_cache:
+            return _gen.__wrapped__(prompt)
+        return _gen(prompt)
+
+
+# Small renovation-themed prompt set used when no dataset file exists
+SAMPLE_ROWS = [
+    {
+        "prompt": "Name one low VOC paint type for a kids bedroom",
+        "expected": "name one low voc paint type for a kids bedroom",
+    },
+    {
+        "prompt": "Suggest an eco friendly flooring option",
+        "expected": "suggest an eco friendly flooring option",
+    },
+    {
+        "prompt": "Which insulation material is most sustainable?",
+        "expected": "wool insulation is the most sustainable choice",
+    },
+    {
+        "prompt": "Name one low VOC paint type for a kids bedroom",
+        "expected": "name one low voc paint type for a kids bedroom",
+    },
+]
+
+
+# Serialized once at import; SAMPLE_ROWS is fixed, so every fresh-dataset
+# run can reuse the same JSONL text
+_SAMPLE_TEXT = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in SAMPLE_ROWS)
+
+
+def create_sample_dataset(path: Path) -> None:
+    """Write the sample prompt dataset as JSONL if it does not exist yet."""
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # One write call instead of a serialize-and-write loop per row
+    path.write_text(_SAMPLE_TEXT, encoding="utf-8")
+
+
+def load_dataset(path: Path) -> List[Example]:
+    """Load prompt/expected examples from a JSONL file."""
+    # One bulk read + per-line orjson parse (stdlib json fallback) instead
+    # of buffered text iteration; orjson takes bytes directly
+    examples = []
+    for line in path.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        item = _json_loads(line)
+        examples.append(Example(prompt=item["prompt"], expected=item["expected"]))
+    return examples
+
+
+def run_experiment(
+    examples: List[Example],
+    client: LLMClient,
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Fill in predictions for every example using the given client.
+
+    Generation calls run concurrently: real clients spend their time
+    waiting on a server or releasing the GIL inside the model, so threads
+    overlap that latency. map() preserves input order.
+    """
+    if not examples:
+        return
+    if max_workers is None:
+        max_workers = min(8, len(examples))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        predictions = pool.map(client.generate, [ex.prompt for ex in examples])
+    for ex, prediction in zip(examples, predictions):
+        ex.prediction = prediction
+
+
+def compute_metrics(examples: List[Example]) -> Dict[str, float]:
+    """
+    Compute exact-match rate and average length difference over examples
+    that have predictions.
+    """
+    scored = [ex for ex in examples if ex.prediction is not None]
+    count = len(scored)
+    if not count:
+        return {
+            "num_examples": 0,
+            "exact_match": 0.0,
+            "avg_length_diff": 0.0,
+            "mean_similarity": 0.0,
+        }
+
+    # Single-pass C loops instead of per-example Python iteration
+    preds = np.array(clean_text_batch([ex.prediction for ex in scored]), dtype=object)
+    exps = np.array(clean_text_batch([ex.expected for ex in scored]), dtype=object)
+    exact = int((preds == exps).sum())
+
+    pred_lens = np.fromiter((len(s) for s in preds), dtype=np.int64, count=count)
+    exp_lens = np.fromiter((len(s) for s in exps), dtype=np.int64, count=count)
+    avg_length_diff = float(np.abs(pred_lens - exp_lens).mean())
+
+    # Normalized edit distance is a far better "near-miss" signal than
+    # length diff; RapidFuzz's bit-parallel C++ scorer makes it cheap.
+    # Without rapidfuzz, fall back to exact match as a degenerate score.
+    if Levenshtein is not None:
+        sims = np.fromiter(
+            (Levenshtein.normalized_similarity(p, e) for p, e in zip(preds, exps)),
+            dtype=np.float64,
+            count=count,
+        )
+        mean_similarity = float(sims.mean())
+    else:
+        mean_similarity = exact / count
+
+    return {
+        "num_examples": count,
+        "exact_match": exact / count,
+        "avg_length_diff": avg_length_diff,
+        "mean_similarity": mean_similarity,
+    }
+
+
+def test_llm_stub_caches_identical_prompts():
+    """Identical prompts should be answered from the prompt cache."""
+    client = LLMClient()
+    before = _gen.cache_info()
+
+    first = client.generate("Same prompt\nacross calls")
+    second = client.generate("Same prompt\nacross calls")
+
+    assert first == second
+    assert _gen.cache_info().hits > before.hits
+    # Bypass flag still returns the same deterministic text
+    assert client.generate("Same prompt\nacross calls", disable_cache=True) == first
+
+
+def test_experiment_end_to_end(tmp_path):
+    """Dataset creation, loading, prediction, and metrics work together."""
+    dataset_path = tmp_path / "sample.jsonl"
+    create_sample_dataset(dataset_path)
+
+    examples = load_dataset(dataset_path)
+    assert len(examples) == len(SAMPLE_ROWS)
+
+    run_experiment(examples, LLMClient())
+    assert all(ex.prediction is not None for ex in examples)
+
+    metrics = compute_metrics(examples)
+    assert metrics["num_examples"] == len(examples)
+    assert 0.0 < metrics["exact_match"] <= 1.0
+    assert metrics["avg_length_diff"] >= 0.0
+    # Similarity can only be as strict as or looser than exact match
+    assert metrics["exact_match"] <= metrics["mean_similarity"] <= 1.0
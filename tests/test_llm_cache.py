@@ -0,0 +1,91 @@
+"""
+Unit tests for the LLM similarity cache.
+
+The embedder is stubbed with fixed vectors so the threshold, alignment,
+persistence, and eviction logic can be exercised without loading a model.
+"""
+
+import numpy as np
+
+from agent.llm_cache import LLMSimilarityCache
+
+
+def _make_cache(tmp_path, **kwargs):
+    """Build a cache with a stubbed embedder mapping prompts to unit vectors."""
+    vectors = {
+        "a": np.array([1.0, 0.0], dtype=np.float32),
+        # Cosine ~0.999 against "a": above the 0.98 threshold
+        "near-a": np.array([0.999, 0.0447], dtype=np.float32),
+        # Cosine ~0.7 against "a": below threshold
+        "far-a": np.array([0.7071, 0.7071], dtype=np.float32),
+        "b": np.array([0.0, 1.0], dtype=np.float32),
+    }
+    cache = LLMSimilarityCache(cache_dir=tmp_path, **kwargs)
+    cache._embed = lambda prompt: vectors[prompt]
+    return cache
+
+
+def test_lookup_threshold(tmp_path):
+    """Only prompts above the cosine threshold return the cached response."""
+    cache = _make_cache(tmp_path)
+    assert cache.lookup("a") is None
+
+    cache.store("a", "resp-a")
+    assert cache.lookup("a") == "resp-a"
+    assert cache.lookup("near-a") == "resp-a"
+    assert cache.lookup("far-a") is None
+    assert cache.lookup("b") is None
+
+
+def test_persistence_roundtrip(tmp_path):
+    """Flushed entries survive into a freshly constructed cache."""
+    cache = _make_cache(tmp_path)
+    cache.store("a", "resp-a")
+    cache.store("b", "resp-b")
+    cache.flush()
+
+    reloaded = _make_cache(tmp_path)
+    assert reloaded.lookup("a") == "resp-a"
+    assert reloaded.lookup("b") == "resp-b"
+
+
+def test_corrupt_files_are_ignored(tmp_path):
+    """Unreadable or misaligned persisted state loads as an empty cache."""
+    cache = _make_cache(tmp_path)
+    cache.store("a", "resp-a")
+    cache.flush()
+
+    # Garbage JSON: both stores are discarded together
+    cache._resp_path.write_text("not json")
+    reloaded = _make_cache(tmp_path)
+    assert reloaded.lookup("a") is None
+
+    # Misaligned stores (one extra response) are also rejected
+    cache.flush()
+    cache._resp_path.write_text('["resp-a", "extra"]')
+    reloaded = _make_cache(tmp_path)
+    assert reloaded.lookup("a") is None
+
+
+def test_eviction_keeps_stores_aligned(tmp_path):
+    """Past max_entries the oldest entry is evicted, newest kept."""
+    cache = _make_cache(tmp_path, max_entries=2)
+    cache.store("a", "resp-a")
+    cache.store("b", "resp-b")
+    cache.store("far-a", "resp-far")
+
+    assert len(cache._responses) == 2
+    assert cache._embeddings.shape[0] == 2
+    assert cache.lookup("a") is None  # evicted
+    assert cache.lookup("b") == "resp-b"
+    assert cache.lookup("far-a") == "resp-far"
+
+
+def test_save_is_batched(tmp_path):
+    """Stores hit disk every SAVE_EVERY inserts, not per call."""
+    cache = _make_cache(tmp_path)
+    cache.store("a", "resp-a")
+    assert not cache._resp_path.exists()
+
+    cache.flush()
+    assert cache._resp_path.exists()
@@ -9,17 +9,24 @@ This test verifies that:
 If the local model file is not present, the test is skipped.
 """
 
+import os
+
 import pytest
 import numpy as np
 from pathlib import Path
 
-from sentence_transformers import SentenceTransformer
-from agent.agent import RenovationAgent
+from _embed_cache import cached_encode, fast_encode
+from _topk import topk_idx
 
 # Path to the local GGUF model used in direct mode
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 MODEL_PATH = PROJECT_ROOT / "models" / "qwen2.5-3b-instruct-q4_k_m.gguf"
 
+# Static system prefix, never interpolated: keeping the opening tokens
+# byte-identical across queries lets llama.cpp reuse its KV prefix cache,
+# so only the per-query Context/Question tail is re-evaluated
+SYSTEM = "You are a helpful renovation assistant. Answer using the provided context."
+
 
 def has_local_model() -> bool:
     """Return True if the local GGUF model file exists."""
@@ -36,7 +43,7 @@ if not has_local_model():
 
 
 @pytest.mark.integration
-def test_llm_with_simple_rag():
+def test_llm_with_simple_rag(st_model, direct_agent):
     """
     Test LLM with a simple RAG scenario:
     1. Create embeddings for sample documents
@@ -52,16 +59,26 @@ def test_llm_with_simple_rag():
 
     query = "What paint should I use for my child's bedroom?"
 
-    # Step 1: embeddings
-    print("\n[Step 1] Loading embedding model...")
-    model = SentenceTransformer("BAAI/bge-small-en-v1.5")
-    
+    # Step 1: embeddings (model is shared via the session-scoped fixture)
+    print("\n[Step 1] Using session embedding model...")
+    model = st_model
+
     print("[Step 2] Encoding documents and query...")
-    doc_embeddings = model.encode(documents, normalize_embeddings=True)
-    query_embedding = model.encode([query], normalize_embeddings=True)[0]
+    # One batched forward pass for documents + query, memoized on disk;
+    # ECO_FAST_TESTS=1 swaps in a TF-IDF encoding with no model at all
+    if os.getenv("ECO_FAST_TESTS"):
+        encoded = fast_encode(documents + [query])
+    else:
+        encoded = cached_encode(model, documents + [query])
+    doc_embeddings, query_embedding = encoded[:-1], encoded[-1]
+
+    # Pin to contiguous float32 so similarity math stays in BLAS sgemv
+    doc_embeddings = np.ascontiguousarray(doc_embeddings, dtype=np.float32)
+    query_embedding = np.ascontiguousarray(query_embedding, dtype=np.float32)
 
     similarities = doc_embeddings @ query_embedding
-    top_doc_idx = int(np.argmax(similarities))
+    assert similarities.dtype == np.float32
+    top_doc_idx = int(topk_idx(similarities, 1)[0])
     relevant_context = documents[top_doc_idx]
 
     print(f"[Step 3] Most relevant document: {relevant_context[:60]}...")
@@ -73,14 +90,10 @@ def test_llm_with_simple_rag():
 
     # Step 2: call LLM in direct mode
     print("[Step 5] Calling LLM in direct mode...")
-    agent = RenovationAgent(mode="direct")
-    prompt = f"""You are a helpful renovation assistant. Answer the user's question based on the provided context.
-
-Context: {relevant_context}
-
-User question: {query}
-
-Please provide a brief, helpful answer (2–3 sentences):"""
+    agent = direct_agent
+    # Dynamic content goes last so the shared SYSTEM prefix stays cacheable
+    user = f"Context: {relevant_context}\n\nQuestion: {query}\n\nAnswer briefly (2-3 sentences):"
+    prompt = SYSTEM + "\n\n" + user
 
     response = agent.call_llm(prompt, max_tokens=100)
     print(f"[Step 6] LLM Response: {response[:200]}...")
@@ -100,10 +113,10 @@ Please provide a brief, helpful answer (2–3 sentences):"""
 
 
 @pytest.mark.integration
-def test_llm_basic_functionality():
+def test_llm_basic_functionality(direct_agent):
     """Basic direct-mode LLM sanity check without RAG."""
     print("\n[Test] Basic LLM functionality (direct mode)...")
-    agent = RenovationAgent(mode="direct")
+    agent = direct_agent
 
     prompt = "Say: Hello, I am working correctly, in one short sentence."
     response = agent.call_llm(prompt, max_tokens=50)
@@ -4,12 +4,54 @@ Test script to verify the pipeline is working correctly.
 Run this after setup to test each component.
 """
 
+import json
 import sys
+import time
 from pathlib import Path
 
+import pytest
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Last-seen-down timestamps per service; lets repeated runs skip the
+# 2s connection timeouts when a service was already found offline
+_SERVICES_PATH = Path(__file__).parent.parent / ".pytest_cache" / "services.json"
+
+
+def _service_down_recently(name: str, ttl: int = 30) -> bool:
+    """Return True if the service failed a probe within the last ttl seconds."""
+    if not _SERVICES_PATH.exists():
+        return False
+    try:
+        stamps = _json_loads(_SERVICES_PATH.read_bytes())
+    except ValueError:
+        return False
+    return time.time() - stamps.get(name, 0) < ttl
+
+
+def _mark_service_down(name: str) -> None:
+    """Record the current time as the service's last failed probe."""
+    stamps = {}
+    if _SERVICES_PATH.exists():
+        try:
+            stamps = _json_loads(_SERVICES_PATH.read_bytes())
+        except ValueError:
+            pass
+    stamps[name] = time.time()
+    try:
+        _SERVICES_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _SERVICES_PATH.write_text(json.dumps(stamps))
+    except OSError:
+        pass
+
 
 def test_imports():
     """Test that all required packages can be imported."""
@@ -43,6 +85,8 @@ def test_data_files():
 def test_qdrant():
     """Test Qdrant connection."""
     print("\nTesting Qdrant connection...")
+    if _service_down_recently("qdrant"):
+        pytest.skip("Qdrant was down within the last 30s, skipping probe")
     try:
         from qdrant_client import QdrantClient
         client = QdrantClient(host="localhost", port=6333)
@@ -51,6 +95,7 @@ def test_qdrant():
         print(f"  Collections: {[c.name for c in collections.collections]}")
         return True
     except Exception as e:
+        _mark_service_down("qdrant")
         print(f"ERROR: Qdrant connection failed: {e}")
         print("  Make sure Qdrant is running: docker-compose up -d")
         return False
@@ -59,6 +104,8 @@ def test_qdrant():
 def test_llm_server():
     """Test LLM server connection."""
     print("\nTesting LLM server...")
+    if _service_down_recently("llm_server"):
+        pytest.skip("LLM server was down within the last 30s, skipping probe")
     try:
         import requests
         response = requests.get("http://localhost:8000/health", timeout=2)
@@ -69,6 +116,7 @@ def test_llm_server():
             print(f"WARNING: LLM server returned status {response.status_code}")
             return False
     except requests.exceptions.ConnectionError:
+        _mark_service_down("llm_server")
         print("WARNING: LLM server not running")
         print("  Start it with: python -m llama_cpp.server --model models/your-model.gguf --host 0.0.0.0 --port 8000")
         return False
@@ -109,10 +157,19 @@ def main():
     
     results = []
     
+    def run_probe(probe):
+        # pytest.skip raises a BaseException subclass; treat it as a
+        # soft failure when running as a plain script
+        try:
+            return probe()
+        except BaseException as e:
+            print(f"SKIP: {e}")
+            return False
+
     results.append(("Imports", test_imports()))
     results.append(("Data Files", test_data_files()))
-    results.append(("Qdrant", test_qdrant()))
-    results.append(("LLM Server", test_llm_server()))
+    results.append(("Qdrant", run_probe(test_qdrant)))
+    results.append(("LLM Server", run_probe(test_llm_server)))
     results.append(("Ingestion", test_ingestion()))
     
     print("\n" + "=" * 50)
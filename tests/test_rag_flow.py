@@ -42,17 +42,17 @@ def test_rag_search():
     return True
 
 
-def test_full_rag():
+def test_full_rag(direct_agent):
     """Test full RAG pipeline: search + LLM."""
     print("=" * 60)
     print("TEST 2: Full RAG Pipeline (Search + LLM)")
     print("=" * 60)
-    
+
     query = "Suggest one eco friendly flooring option for a kids bedroom and explain briefly why it is suitable."
     print(f"\nQuery: {query}\n")
-    
-    # Initialize agent (direct mode)
-    agent = RenovationAgent(mode="direct")
+
+    # Shared session agent (avoids reloading the GGUF model per test)
+    agent = direct_agent
     
     print("Calling agent...\n")
     response = agent.agent(query, top_k_docs=3)
@@ -90,7 +90,7 @@ if __name__ == "__main__":
     
     # Test 2: Full RAG
     try:
-        rag_ok = test_full_rag()
+        rag_ok = test_full_rag(RenovationAgent(mode="direct"))
         if rag_ok:
             print("\n[PASS] All tests passed! RAG is working correctly.")
             sys.exit(0)
@@ -1,19 +1,34 @@
+import os
+
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+from _embed_cache import cached_encode, fast_encode
+from _topk import topk_idx
 
 
-def test_low_voc_sentence_is_most_similar(sample_sentences):
+def test_low_voc_sentence_is_most_similar(sample_sentences, st_model):
     """Ensure cosine similarity ranks the low VOC paint sentence highest."""
-    model = SentenceTransformer("BAAI/bge-small-en-v1.5")
+    model = st_model
 
     sentences = sample_sentences
     query = "What is a good low VOC option for kids bedroom walls?"
 
-    sentence_embeddings = model.encode(sentences, normalize_embeddings=True)
-    query_embedding = model.encode([query], normalize_embeddings=True)[0]
+    # One batched forward pass for sentences + query, memoized on disk;
+    # ECO_FAST_TESTS=1 swaps in a TF-IDF encoding with no model at all
+    if os.getenv("ECO_FAST_TESTS"):
+        encoded = fast_encode(sentences + [query])
+    else:
+        encoded = cached_encode(model, sentences + [query])
+    sentence_embeddings, query_embedding = encoded[:-1], encoded[-1]
+
+    # Pin everything to contiguous float32 so the matvec stays in BLAS
+    # sgemv; a silent float64 upcast would double the bytes moved
+    sentence_embeddings = np.ascontiguousarray(sentence_embeddings, dtype=np.float32)
+    query_embedding = np.ascontiguousarray(query_embedding, dtype=np.float32)
 
     similarities = sentence_embeddings @ query_embedding
-    top_match_idx = int(np.argmax(similarities))
+    assert similarities.dtype == np.float32
+    top_match_idx = int(topk_idx(similarities, 1)[0])
 
     assert (
         sentences[top_match_idx] == sentences[0]
@@ -2,9 +2,23 @@
 Gradio UI for EcoRenoAdvisor.
 """
 
+import functools
+
 import gradio as gr
 from pathlib import Path
-from agent.agent import agent
+from types import MappingProxyType
+
+# Built once at import instead of per request; read-only view guards
+# against accidental mutation from handlers
+_VOC_MAPPING = MappingProxyType(
+    {
+        "Any": None,
+        "Zero": 0,
+        "Low": 1,
+        "Medium": 2,
+        "High": 3,
+    }
+)
 
 
 def run_agent(
@@ -30,22 +44,23 @@ def run_agent(
     if not query.strip():
         return "Please enter a question."
 
-    voc_mapping = {
-        "Any": None,
-        "Zero": 0,
-        "Low": 1,
-        "Medium": 2,
-        "High": 3,
-    }
-    voc_num = voc_mapping.get(voc_level, None)
+    # Imported here so the UI module loads fast; the agent pulls in the
+    # embedding model and LLM stack, which only the first query needs
+    from agent.agent import agent
+
+    voc_num = _VOC_MAPPING.get(voc_level, None)
 
+    # Build the filters dict in one pass, dropping unset values as we go
     filters = {
-        "category": category if category.strip() else None,
-        "max_price": budget if budget > 0 else None,
-        "min_eco": eco if eco > 0 else None,
-        "voc": voc_num,
+        k: v
+        for k, v in (
+            ("category", category if category.strip() else None),
+            ("max_price", budget if budget > 0 else None),
+            ("min_eco", eco if eco > 0 else None),
+            ("voc", voc_num),
+        )
+        if v is not None
     }
-    filters = {k: v for k, v in filters.items() if v is not None}
 
     try:
         response = agent(query, filters)
@@ -152,139 +167,150 @@ h1, h2, h3 {
 }
 """
 
-# Get image path
-image_path = Path(__file__).parent.parent / "images" / "ssty_01.jpg"
-image_path_str = str(image_path) if image_path.exists() else None
-
-# Create Gradio interface
-with gr.Blocks(theme=custom_theme, title="EcoRenoAdvisor", css=custom_css) as iface:
-    # Header
-    with gr.Row():
-        with gr.Column(scale=1, min_width=200):
-            if image_path_str:
-                gr.Image(
-                    value=image_path_str,
+
+@functools.cache
+def build_interface() -> gr.Blocks:
+    """
+    Construct and return the Gradio interface without launching it.
+
+    Cached: every entrypoint (tests, __main__, other launchers) shares a
+    single Blocks tree instead of rebuilding components and callbacks.
+    """
+    # Get image path
+    image_path = Path(__file__).parent.parent / "images" / "ssty_01.jpg"
+    image_path_str = str(image_path) if image_path.exists() else None
+
+    # Create Gradio interface
+    with gr.Blocks(theme=custom_theme, title="EcoRenoAdvisor", css=custom_css) as iface:
+        # Header
+        with gr.Row():
+            with gr.Column(scale=1, min_width=200):
+                if image_path_str:
+                    gr.Image(
+                        value=image_path_str,
+                        show_label=False,
+                        show_download_button=False,
+                        height=120,
+                        width=200,
+                        container=True,
+                        elem_classes="header-image",
+                    )
+            with gr.Column(scale=4):
+                gr.Markdown(
+                    """
+                    # EcoRenoAdvisor
+                    ### Personalized, Eco-Friendly Renovation Advice
+
+                    Get AI-powered recommendations based on sustainable materials and expert documents.
+                    """,
+                    elem_classes="header-text",
+                )
+
+        gr.Markdown("---")
+
+        # Main content
+        with gr.Row():
+            # Filters column
+            with gr.Column(scale=1):
+                gr.Markdown("### Filters")
+                category_input = gr.Textbox(
+                    label="Category (optional)",
+                    placeholder="e.g., flooring, insulation, paint",
+                    lines=1,
+                    elem_classes="category",
+                )
+                budget_input = gr.Slider(
+                    minimum=0,
+                    maximum=200,
+                    value=100,
+                    step=5,
+                    label="Max Price per m² ($)",
+                    elem_classes="price",
+                )
+                eco_input = gr.Slider(
+                    minimum=0.0,
+                    maximum=1.0,
+                    value=0.0,
+                    step=0.1,
+                    label="Min Eco Score",
+                    elem_classes="eco",
+                )
+                # Manual label + dropdown, to avoid the red pill style
+                gr.Markdown("**Max VOC Level**", elem_classes="voc-label")
+                voc_input = gr.Dropdown(
+                    choices=["Any", "Zero", "Low", "Medium", "High"],
+                    value="Any",
+                    label="",           # no auto label
                     show_label=False,
-                    show_download_button=False,
-                    height=120,
-                    width=200,
-                    container=True,
-                    elem_classes="header-image",
+                    elem_classes="voc",
                 )
-        with gr.Column(scale=4):
-            gr.Markdown(
-                """
-                # EcoRenoAdvisor
-                ### Personalized, Eco-Friendly Renovation Advice
-
-                Get AI-powered recommendations based on sustainable materials and expert documents.
-                """,
-                elem_classes="header-text",
-            )
-
-    gr.Markdown("---")
-
-    # Main content
-    with gr.Row():
-        # Filters column
-        with gr.Column(scale=1):
-            gr.Markdown("### Filters")
-            category_input = gr.Textbox(
-                label="Category (optional)",
-                placeholder="e.g., flooring, insulation, paint",
-                lines=1,
-                elem_classes="category",
-            )
-            budget_input = gr.Slider(
-                minimum=0,
-                maximum=200,
-                value=100,
-                step=5,
-                label="Max Price per m² ($)",
-                elem_classes="price",
-            )
-            eco_input = gr.Slider(
-                minimum=0.0,
-                maximum=1.0,
-                value=0.0,
-                step=0.1,
-                label="Min Eco Score",
-                elem_classes="eco",
-            )
-            # Manual label + dropdown, to avoid the red pill style
-            gr.Markdown("**Max VOC Level**", elem_classes="voc-label")
-            voc_input = gr.Dropdown(
-                choices=["Any", "Zero", "Low", "Medium", "High"],
-                value="Any",
-                label="",           # no auto label
-                show_label=False,
-                elem_classes="voc",
-            )
-
-        # Question and answer column
-        with gr.Column(scale=2):
-            gr.Markdown("### Ask Your Question")
-            query_input = gr.Textbox(
-                label="Your Question",
-                placeholder=(
-                    "e.g., For a 12 m² kids room, find two low VOC flooring options, "
-                    "mid price, eco_score above 0.7. Compare pros and cons."
-                ),
-                lines=4,
-                elem_classes="query",
-            )
-            submit_btn = gr.Button("Get Recommendation", variant="primary", size="lg")
-
-            gr.Markdown("### Recommendation")
-            output = gr.Textbox(
-                label="",
-                lines=12,
-                show_label=False,
-                elem_classes="recommendation-box",
-            )
-
-    # Examples
-    gr.Markdown("---")
-    gr.Markdown("### Example Questions")
-    gr.Examples(
-        examples=[
-            [
-                "Find low VOC flooring options for a kids room, mid price range, eco score above 0.7",
-                "flooring",
-                80,
-                0.7,
-                "Low",
-            ],
-            [
-                "Compare insulation materials for bedrooms",
-                "insulation",
-                150,
-                0.5,
-                "Any",
-            ],
-            [
-                "What are the most sustainable paint options within my budget?",
-                "paint",
-                50,
-                0.8,
-                "Low",
+
+            # Question and answer column
+            with gr.Column(scale=2):
+                gr.Markdown("### Ask Your Question")
+                query_input = gr.Textbox(
+                    label="Your Question",
+                    placeholder=(
+                        "e.g., For a 12 m² kids room, find two low VOC flooring options, "
+                        "mid price, eco_score above 0.7. Compare pros and cons."
+                    ),
+                    lines=4,
+                    elem_classes="query",
+                )
+                submit_btn = gr.Button("Get Recommendation", variant="primary", size="lg")
+
+                gr.Markdown("### Recommendation")
+                output = gr.Textbox(
+                    label="",
+                    lines=12,
+                    show_label=False,
+                    elem_classes="recommendation-box",
+                )
+
+        # Examples
+        gr.Markdown("---")
+        gr.Markdown("### Example Questions")
+        gr.Examples(
+            examples=[
+                [
+                    "Find low VOC flooring options for a kids room, mid price range, eco score above 0.7",
+                    "flooring",
+                    80,
+                    0.7,
+                    "Low",
+                ],
+                [
+                    "Compare insulation materials for bedrooms",
+                    "insulation",
+                    150,
+                    0.5,
+                    "Any",
+                ],
+                [
+                    "What are the most sustainable paint options within my budget?",
+                    "paint",
+                    50,
+                    0.8,
+                    "Low",
+                ],
             ],
-        ],
-        inputs=[query_input, category_input, budget_input, eco_input, voc_input],
-        label="Click an example to try it:",
-    )
+            inputs=[query_input, category_input, budget_input, eco_input, voc_input],
+            label="Click an example to try it:",
+        )
 
-    # Button and enter key
-    submit_btn.click(
-        fn=run_agent,
-        inputs=[query_input, category_input, budget_input, eco_input, voc_input],
-        outputs=output,
-    )
-    query_input.submit(
-        fn=run_agent,
-        inputs=[query_input, category_input, budget_input, eco_input, voc_input],
-        outputs=output,
-    )
+        # Button and enter key
+        submit_btn.click(
+            fn=run_agent,
+            inputs=[query_input, category_input, budget_input, eco_input, voc_input],
+            outputs=output,
+        )
+        query_input.submit(
+            fn=run_agent,
+            inputs=[query_input, category_input, budget_input, eco_input, voc_input],
+            outputs=output,
+        )
+
+    return iface
 
 
 if __name__ == "__main__":
@@ -293,19 +319,17 @@ if __name__ == "__main__":
 
     os.environ["GRADIO_ANALYTICS_ENABLED"] = "False"
 
-    port = 7860
-    for p in range(7860, 7870):
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex(("localhost", p))
-        sock.close()
-        if result != 0:
-            port = p
-            if p != 7860:
-                print(f"Port 7860 in use, using port {port} instead")
-            break
-    else:
-        print("Warning: Could not find available port in range 7860-7869, trying 7860 anyway")
-        port = 7860
-
-    iface.launch(server_name="0.0.0.0", server_port=port, share=False, show_error=False)
+    # Single bind attempt instead of probing ports one by one: try 7860,
+    # and fall back to an OS-assigned ephemeral port if it is taken
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("", 7860))
+        except OSError:
+            sock.bind(("", 0))
+            print(f"Port 7860 in use, using port {sock.getsockname()[1]} instead")
+        port = sock.getsockname()[1]
+
+    build_interface().launch(
+        server_name="0.0.0.0", server_port=port, share=False, show_error=False
+    )